@@ -1,9 +1,10 @@
 
 import os
+import re
 import sys
 import json
-import argparse
-import subprocess
+import functools
+import shlex
 from pathlib import Path
 
 FOTO_DIR = Path.home() / ".footo"
@@ -12,60 +13,205 @@ LOCAL_MODULES_DIR = MODULES_DIR / "local"
 BUNDLED_MODULES_DIR = MODULES_DIR / "bundled"
 COMMUNITY_MODULES_DIR = MODULES_DIR / "community"
 
+# Prefer orjson's C decoder for reading meta.json; stdlib json remains the
+# fallback (and the writer, since create_module wants indent=2 output).
+try:
+    import orjson
+    _loads = orjson.loads
+    _JSON_ERRORS = (json.JSONDecodeError, orjson.JSONDecodeError)
+except ImportError:
+    _loads = json.loads
+    _JSON_ERRORS = (json.JSONDecodeError,)
+
+# Editors that fork a GUI and return immediately; launching them detached
+# frees the CLI without waiting for the window to close.
+_GUI_EDITORS = {"code", "codium", "subl", "gedit"}
+
+# Prebuilt help for the bare `footo` case, mirroring argparse's output, so
+# printing it needs neither the parser nor any filesystem work.
+_HELP_TEXT = """\
+usage: footo [-h] {create,run,list,info} ...
+
+Footo: A command interface for reusable terminal functions.
+
+positional arguments:
+  {create,run,list,info}
+    create              Create a new module.
+    run                 Run a module.
+    list                List all available modules.
+    info                Get information about a module.
+
+options:
+  -h, --help            show this help message and exit
+"""
+
+# Module names become directory names, so reject anything with separators
+# or other surprises before touching the filesystem.
+_NAME_RE = re.compile(r'\A[A-Za-z0-9_.-]{1,64}\Z')
+
+def _is_valid_module_name(module_name):
+    """True if the name is safe to use as a module directory name."""
+    return bool(_NAME_RE.match(module_name)) and module_name not in (".", "..")
+
+class MetaError(Exception):
+    """Raised when a module's meta.json cannot be read or parsed."""
+
+class MetaNotFoundError(MetaError):
+    """The module has no meta.json."""
+
+class InvalidMetaError(MetaError):
+    """The module's meta.json is not valid JSON."""
+
+# Parsed meta.json contents keyed by path, invalidated on (mtime, size) change,
+# so repeated lookups in one process parse each file at most once.
+_META_CACHE = {}
+
+def _load_meta(meta_file):
+    """Loads and parses a module's meta.json, caching the result.
+
+    Accepts a Path or a plain string; cache keys are normalized to strings
+    so both spellings of the same path share an entry.
+    """
+    meta_file = os.fspath(meta_file)
+    try:
+        st = os.stat(meta_file)
+    except FileNotFoundError:
+        raise MetaNotFoundError(meta_file)
+
+    cached = _META_CACHE.get(meta_file)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    try:
+        with open(meta_file, 'rb') as f:
+            meta = _loads(f.read())
+    except FileNotFoundError:
+        raise MetaNotFoundError(meta_file)
+    except _JSON_ERRORS:
+        raise InvalidMetaError(meta_file)
+
+    _META_CACHE[meta_file] = (st.st_mtime_ns, st.st_size, meta)
+    return meta
+
+def _iter_modules(scope_dir):
+    """Yields a DirEntry for each module directory inside a scope.
+
+    Uses os.scandir so the is_dir check reuses the d_type returned by the
+    directory read instead of issuing a stat per entry.
+    """
+    try:
+        entries = os.scandir(scope_dir)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield entry
+
+@functools.lru_cache(maxsize=1)
+def _build_module_index():
+    """Builds {module_name: (scope_name, path)} across all scopes in one pass.
+
+    Earlier scopes win on name conflicts, matching the local-then-bundled
+    lookup order.
+    """
+    index = {}
+    for scope_name, scope_dir in (("local", LOCAL_MODULES_DIR),
+                                  ("bundled", BUNDLED_MODULES_DIR),
+                                  ("community", COMMUNITY_MODULES_DIR)):
+        for entry in _iter_modules(scope_dir):
+            index.setdefault(entry.name, (scope_name, Path(entry.path)))
+    return index
+
+def _invalidate_index():
+    """Clears the cached module index after modules are added or removed."""
+    _build_module_index.cache_clear()
+
+def _find_module_dir(module_name):
+    """Returns (module_dir, scope_name) for a module, or (None, None)."""
+    hit = _build_module_index().get(module_name)
+    if hit is None:
+        return None, None
+    scope_name, module_dir = hit
+    return module_dir, scope_name
+
 def initialize_directories():
     """Creates the necessary directory structure for Footo if it doesn't exist."""
-    if not FOTO_DIR.exists():
-        print("Initializing Footo directories...")
+    try:
+        # The deepest directory existing means the whole tree is in place.
+        os.stat(COMMUNITY_MODULES_DIR)
+        return
+    except FileNotFoundError:
+        pass
+
+    print("Initializing Footo directories...")
     FOTO_DIR.mkdir(exist_ok=True)
     MODULES_DIR.mkdir(exist_ok=True)
     LOCAL_MODULES_DIR.mkdir(exist_ok=True)
     BUNDLED_MODULES_DIR.mkdir(exist_ok=True)
     COMMUNITY_MODULES_DIR.mkdir(exist_ok=True)
-    if not FOTO_DIR.exists(): # Only print if it was actually created
-        print(f"Created directory structure at: {FOTO_DIR}")
 
 def list_modules():
     """Lists all available modules, grouped by scope."""
-    print("Available modules:")
+    # Collect the whole listing and emit it with one write instead of a
+    # print per line.
+    out = ["Available modules:\n"]
+    append = out.append
 
     def print_modules_in_scope(scope_dir, scope_name):
-        print(f"  {scope_name}:")
-        if not scope_dir.exists() or not any(scope_dir.iterdir()):
-            print("    (no modules found)")
+        append(f"  {scope_name}:\n")
+        # One scandir pass answers both "is the scope empty?" and provides
+        # the entries, which need materializing for sorting anyway.
+        entries = list(_iter_modules(scope_dir))
+        if not entries:
+            append("    (no modules found)\n")
             return
 
-        for module_dir in sorted(scope_dir.iterdir()):
-            if module_dir.is_dir():
-                meta_file = module_dir / "meta.json"
-                if meta_file.exists():
-                    try:
-                        with open(meta_file, 'r') as f:
-                            meta = json.load(f)
-                        print(f"    - {meta.get('name', module_dir.name)} (v{meta.get('version', 'N/A')})")
-                        print(f"      {meta.get('description', '')}")
-                    except json.JSONDecodeError:
-                        print(f"    - {module_dir.name} (Error: Invalid meta.json)")
-                else:
-                    print(f"    - {module_dir.name} (Error: meta.json not found)")
+        entries.sort(key=lambda e: e.name)
+        for entry in entries:
+            # DirEntry.path is already a plain string; joining it avoids a
+            # Path allocation per module.
+            meta_file = os.path.join(entry.path, "meta.json")
+            try:
+                get = _load_meta(meta_file).get
+                append(f"    - {get('name', entry.name)} (v{get('version', 'N/A')})\n"
+                       f"      {get('description', '')}\n")
+            except InvalidMetaError:
+                append(f"    - {entry.name} (Error: Invalid meta.json)\n")
+            except MetaNotFoundError:
+                append(f"    - {entry.name} (Error: meta.json not found)\n")
 
     print_modules_in_scope(LOCAL_MODULES_DIR, "local")
     print_modules_in_scope(BUNDLED_MODULES_DIR, "bundled")
+    sys.stdout.write("".join(out))
 
 def create_module(module_name):
     """Creates a new module template."""
+    if not _is_valid_module_name(module_name):
+        print(f"Error: Invalid module name '{module_name}'.")
+        return
+
     module_path = LOCAL_MODULES_DIR / module_name
 
-    if module_path.exists():
-        print(f"Error: Module '{module_name}' already exists in local scope.")
+    # One index lookup covers name conflicts in every scope
+    existing = _build_module_index().get(module_name)
+    if existing is not None:
+        scope_name, _ = existing
+        if scope_name == "local":
+            print(f"Error: Module '{module_name}' already exists in local scope.")
+        else:
+            print(f"Error: Module '{module_name}' already exists in {scope_name} scope. Please choose a different name.")
         return
 
-    # Check if module exists in bundled scope (to avoid name conflicts)
-    if (BUNDLED_MODULES_DIR / module_name).exists():
-        print(f"Error: Module '{module_name}' already exists in bundled scope. Please choose a different name.")
+    try:
+        module_path.mkdir(parents=True)
+    except FileExistsError:
+        # The index only tracks directories; a stray file or symlink with
+        # this name still occupies the path.
+        print(f"Error: Module '{module_name}' already exists in local scope.")
         return
-
+    _invalidate_index()
     print(f"Creating new module: {module_name} at {module_path}")
-    module_path.mkdir(parents=True)
 
     # Determine shell type for default script
     # For now, default to bash. Will implement shell detection later.
@@ -81,13 +227,15 @@ def create_module(module_name):
     }
 
     meta_file = module_path / "meta.json"
-    with open(meta_file, 'w') as f:
-        json.dump(meta_content, f, indent=2)
+    # Write-then-rename so a concurrent list/info never reads a torn file;
+    # os.replace is atomic on both POSIX and Windows.
+    tmp_file = meta_file.with_suffix(".json.tmp")
+    tmp_file.write_text(json.dumps(meta_content, indent=2))
+    os.replace(tmp_file, meta_file)
 
     script_content = f"#!/{script_lang}/bin/{script_lang}\n\necho \"Hello from {module_name}!\"\n"
     script_file = module_path / f"script{script_ext}"
-    with open(script_file, 'w') as f:
-        f.write(script_content)
+    script_file.write_text(script_content)
 
     print(f"Module '{module_name}' created successfully.")
     print(f"You can edit your module files here: {module_path}")
@@ -95,9 +243,16 @@ def create_module(module_name):
     # Attempt to open editor
     editor = os.environ.get('EDITOR')
     if editor:
+        # Only the editor launch needs subprocess; keep it off the startup path.
+        import subprocess
         try:
             print(f"Opening files in {editor}...")
-            subprocess.run([editor, str(meta_file), str(script_file)])
+            editor_cmd = [editor, str(meta_file), str(script_file)]
+            if os.path.basename(editor) in _GUI_EDITORS:
+                # Don't block on GUI editors; detach and return immediately.
+                subprocess.Popen(editor_cmd, start_new_session=True)
+            else:
+                subprocess.call(editor_cmd)
         except FileNotFoundError:
             print(f"Warning: Editor '{editor}' not found. Please open files manually.")
     else:
@@ -105,80 +260,61 @@ def create_module(module_name):
 
 def get_module_info(module_name):
     """Displays information about a specific module."""
-    module_meta = None
-    module_scope = None
-    module_dir = None
-
-    # Check local scope
-    local_module_path = LOCAL_MODULES_DIR / module_name
-    if local_module_path.exists() and local_module_path.is_dir():
-        module_dir = local_module_path
-        module_scope = "local"
-    else:
-        # Check bundled scope
-        bundled_module_path = BUNDLED_MODULES_DIR / module_name
-        if bundled_module_path.exists() and bundled_module_path.is_dir():
-            module_dir = bundled_module_path
-            module_scope = "bundled"
+    if not _is_valid_module_name(module_name):
+        print(f"Error: Invalid module name '{module_name}'.")
+        return
+
+    module_dir, module_scope = _find_module_dir(module_name)
 
     if module_dir:
         meta_file = module_dir / "meta.json"
-        if meta_file.exists():
-            try:
-                with open(meta_file, 'r') as f:
-                    module_meta = json.load(f)
-                
-                print(f"Module: {module_meta.get('name', module_name)}")
-                print(f"  Scope: {module_scope}")
-                print(f"  Version: {module_meta.get('version', 'N/A')}")
-                print(f"  Description: {module_meta.get('description', 'N/A')}")
-                print(f"  Language: {module_meta.get('lang', 'N/A')}")
-                print(f"  Entry Script: {module_meta.get('entry', 'N/A')}")
-                print(f"  Path: {module_dir}")
-
-                if 'args' in module_meta and module_meta['args']:
-                    print("\n  Arguments:")
-                    for arg in module_meta['args']:
-                        print(f"    {arg.get('name', 'N/A')}:")
-                        print(f"      Description: {arg.get('description', 'N/A')}")
-                        print(f"      Type: {arg.get('type', 'N/A')}")
-                        if 'defaultValue' in arg:
-                            print(f"      Default: {arg.get('defaultValue')}")
-
-            except json.JSONDecodeError:
-                print(f"Error: Invalid meta.json for module '{module_name}' at {meta_file}")
-        else:
+        try:
+            module_meta = _load_meta(meta_file)
+            get = module_meta.get
+
+            print(f"Module: {get('name', module_name)}")
+            print(f"  Scope: {module_scope}")
+            print(f"  Version: {get('version', 'N/A')}")
+            print(f"  Description: {get('description', 'N/A')}")
+            print(f"  Language: {get('lang', 'N/A')}")
+            print(f"  Entry Script: {get('entry', 'N/A')}")
+            print(f"  Path: {module_dir}")
+
+            if 'args' in module_meta and module_meta['args']:
+                print("\n  Arguments:")
+                for arg in module_meta['args']:
+                    print(f"    {arg.get('name', 'N/A')}:")
+                    print(f"      Description: {arg.get('description', 'N/A')}")
+                    print(f"      Type: {arg.get('type', 'N/A')}")
+                    if 'defaultValue' in arg:
+                        print(f"      Default: {arg.get('defaultValue')}")
+
+        except InvalidMetaError:
+            print(f"Error: Invalid meta.json for module '{module_name}' at {meta_file}")
+        except MetaNotFoundError:
             print(f"Error: meta.json not found for module '{module_name}' at {module_dir}")
     else:
         print(f"Error: Module '{module_name}' not found in local or bundled scope.")
 
 def run_module(module_name, args):
     """Executes a module by printing the command to source it."""
-    module_meta = None
-    module_dir = None
+    if not _is_valid_module_name(module_name):
+        print(f"Error: Invalid module name '{module_name}'.", file=sys.stderr)
+        sys.exit(1)
 
-    # Search for module
-    local_module_path = LOCAL_MODULES_DIR / module_name
-    if local_module_path.exists() and local_module_path.is_dir():
-        module_dir = local_module_path
-    else:
-        bundled_module_path = BUNDLED_MODULES_DIR / module_name
-        if bundled_module_path.exists() and bundled_module_path.is_dir():
-            module_dir = bundled_module_path
+    module_dir, _ = _find_module_dir(module_name)
 
     if not module_dir:
         print(f"Error: Module '{module_name}' not found in local or bundled scope.", file=sys.stderr)
         sys.exit(1)
 
     meta_file = module_dir / "meta.json"
-    if not meta_file.exists():
+    try:
+        module_meta = _load_meta(meta_file)
+    except MetaNotFoundError:
         print(f"Error: meta.json not found for module '{module_name}' at {module_dir}", file=sys.stderr)
         sys.exit(1)
-
-    try:
-        with open(meta_file, 'r') as f:
-            module_meta = json.load(f)
-    except json.JSONDecodeError:
+    except InvalidMetaError:
         print(f"Error: Invalid meta.json for module '{module_name}' at {meta_file}", file=sys.stderr)
         sys.exit(1)
 
@@ -189,8 +325,10 @@ def run_module(module_name, args):
         print(f"Error: 'lang' or 'entry' missing in meta.json for module '{module_name}'.", file=sys.stderr)
         sys.exit(1)
 
-    entry_script_path = module_dir / entry_script_name
-    if not entry_script_path.exists():
+    # Convert the path to a string once; it is needed for both the existence
+    # check and the emitted command.
+    entry_script_path = os.fspath(module_dir / entry_script_name)
+    if not os.path.exists(entry_script_path):
         print(f"Error: Entry script '{entry_script_name}' not found for module '{module_name}' at {module_dir}", file=sys.stderr)
         sys.exit(1)
 
@@ -203,20 +341,50 @@ def run_module(module_name, args):
         print(f"Error: Unsupported script language '{script_lang}' for module '{module_name}'.", file=sys.stderr)
         sys.exit(1)
 
-    # Escape arguments for shell execution
-    escaped_args = [f"\'{arg}\'" for arg in args] # Simple escaping, might need more robust solution
-
-    # Print the command to be sourced by the parent shell
-    print(f"{command_prefix} \"{entry_script_path}\" {' '.join(escaped_args)}")
+    # Emit the command to be sourced by the parent shell. One raw write to
+    # fd 1 keeps this a single syscall with no buffering between the CLI
+    # and the shell's command substitution; everything else on the run path
+    # writes to stderr only.
+    line = f"{command_prefix} {shlex.quote(entry_script_path)} {shlex.join(args)}\n"
+    os.write(1, line.encode())
 
 def main():
     """Main entry point for the Footo CLI."""
+    # Bare `footo` just wants the help text; skip the parser and the
+    # directory checks entirely.
+    if len(sys.argv) == 1:
+        sys.stdout.write(_HELP_TEXT)
+        return
+
     initialize_directories()
 
+    argv = sys.argv[1:]
+
+    # Fast path: dispatch the hot commands straight off argv so `footo run`
+    # and `footo list` never pay for building the argparse tree.
+    if argv:
+        command = argv[0]
+        if command == "list":
+            list_modules()
+            return
+        if command == "run":
+            if len(argv) < 2:
+                print("Error: 'run' requires a module name.", file=sys.stderr)
+                sys.exit(2)
+            run_module(argv[1], argv[2:])
+            return
+        if command not in ("create", "info", "-h", "--help"):
+            # No known command: treat the first argument as a module name,
+            # shorthand for `footo run <name>`.
+            run_module(command, argv[1:])
+            return
+
+    # Slow path: create/info/help go through argparse.
+    import argparse
+
     parser = argparse.ArgumentParser(description="Footo: A command interface for reusable terminal functions.")
     subparsers = parser.add_subparsers(dest="command")
 
-    # To be implemented: create, run, list, info commands
     parser_create = subparsers.add_parser("create", help="Create a new module.")
     parser_create.add_argument("name", help="The name of the module to create.")
 
@@ -229,26 +397,13 @@ def main():
     parser_info = subparsers.add_parser("info", help="Get information about a module.")
     parser_info.add_argument("name", help="The name of the module.")
 
-    # If no command is given, treat it as a module execution
-    if len(sys.argv) > 1 and sys.argv[1] not in subparsers.choices:
-        # This is where the module execution logic will go
-        # For now, we'll just print a message
-        print(f"Attempting to execute module: {sys.argv[1]}")
-        # In a real implementation, this would trigger the `run` command logic.
-        # For now, we'll re-parse with 'run' as the command.
-        args = parser.parse_args(['run'] + sys.argv[1:])
-    else:
-        args = parser.parse_args()
+    args = parser.parse_args()
 
     if args.command == "create":
         create_module(args.name)
-    elif args.command == "run":
-        run_module(args.name, args.args)
-    elif args.command == "list":
-        list_modules()
     elif args.command == "info":
         get_module_info(args.name)
-    elif args.command is None and len(sys.argv) == 1:
+    else:
         parser.print_help()
 
 
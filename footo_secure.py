@@ -4,18 +4,25 @@ Footo - Secure Terminal Module Manager
 Version: 1.1.0 (Security Hardened)
 """
 
+import functools
 import os
 import sys
 import json
 import argparse
-import subprocess
 import logging
 import re
-import shlex
 import stat
+import types
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# Use orjson's C decoder for metadata when available; stdlib json otherwise
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Constants
 FOOTO_VERSION = "1.1.0"
 MAX_MODULE_NAME_LENGTH = 50
@@ -23,6 +30,33 @@ MAX_SCRIPT_SIZE = 10 * 1024 * 1024  # 10MB
 MAX_META_SIZE = 100 * 1024  # 100KB
 EXECUTION_TIMEOUT = 300  # 5 minutes
 
+# Validation patterns, compiled once so hot paths skip re's cache lookup
+_MODULE_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]+\Z')
+_VERSION_RE = re.compile(r'^\d+\.\d+\.\d+\Z')
+
+# Characters that force shell quoting; same rule as shlex.quote but with
+# the pattern compiled once instead of per call
+_UNSAFE_SHELL_RE = re.compile(r'[^\w@%+=:,./-]', re.ASCII)
+
+# Editor whitelists: GUI editors daemonize and are launched detached,
+# terminal editors hold the foreground until the user finishes editing
+_GUI_EDITORS = frozenset({
+    'code', 'notepad', 'notepad++', 'subl', 'sublime', 'atom', 'gedit', 'kate'
+})
+_TTY_EDITORS = frozenset({'nano', 'vim', 'vi', 'emacs', 'micro', 'joe', 'ne'})
+
+# Windows reserved device names, pre-lowercased for O(1) membership checks
+_RESERVED_NAMES = frozenset({
+    'con', 'prn', 'aux', 'nul', 'com1', 'com2', 'com3', 'com4',
+    'lpt1', 'lpt2', 'lpt3', 'lpt4'
+})
+
+def _shell_quote(s: str) -> str:
+    """Return a shell-escaped version of s (shlex.quote without its per-call overhead)."""
+    if s and _UNSAFE_SHELL_RE.search(s) is None:
+        return s
+    return "'" + s.replace("'", "'\"'\"'") + "'"
+
 # Paths (with environment override support)
 FOOTO_HOME = os.environ.get('FOOTO_HOME', str(Path.home() / ".footo"))
 FOTO_DIR = Path(FOOTO_HOME)
@@ -31,6 +65,7 @@ LOCAL_MODULES_DIR = MODULES_DIR / "local"
 BUNDLED_MODULES_DIR = MODULES_DIR / "bundled"
 COMMUNITY_MODULES_DIR = MODULES_DIR / "community"
 LOG_FILE = FOTO_DIR / "footo.log"
+INIT_SENTINEL = FOTO_DIR / ".initialized"
 
 # Custom Exceptions
 class FootoError(Exception):
@@ -54,25 +89,37 @@ class ValidationError(FootoError):
     pass
 
 # Logging Setup
-def setup_logging():
-    """Initialize logging with rotation and proper formatting."""
+#
+# The logger starts with a NullHandler so importing the module (or bailing
+# out on --help/--version) touches neither the terminal nor the disk; real
+# handlers are attached by _configure_logging once a command actually runs.
+logger = logging.getLogger('footo')
+logger.addHandler(logging.NullHandler())
+
+_logging_configured = False
+
+def _configure_logging() -> None:
+    """Initialize logging with proper formatting; safe to call repeatedly."""
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    
+
     # Ensure log directory exists
     LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Configure logging
+
+    # Configure logging; delay=True keeps the log file closed until the
+    # first record is actually emitted
     logging.basicConfig(
         level=logging.INFO,
         format=log_format,
         handlers=[
             logging.StreamHandler(sys.stderr),
-            logging.FileHandler(LOG_FILE, encoding='utf-8')
+            logging.FileHandler(LOG_FILE, encoding='utf-8', delay=True)
         ]
     )
-    return logging.getLogger('footo')
-
-logger = setup_logging()
 
 # Security Functions
 def validate_module_name(name: str) -> str:
@@ -95,60 +142,76 @@ def validate_module_name(name: str) -> str:
         raise ValidationError(f"Module name too long (max {MAX_MODULE_NAME_LENGTH} chars)")
     
     # Only allow alphanumeric, hyphens, underscores
-    if not re.match(r'^[a-zA-Z0-9_-]+$', name):
+    if not _MODULE_NAME_RE.match(name):
         raise ValidationError(
             "Module name can only contain letters, numbers, hyphens, and underscores"
         )
     
     # Prevent Windows reserved names
-    reserved_names = ['con', 'prn', 'aux', 'nul', 'com1', 'com2', 'com3', 'com4',
-                      'lpt1', 'lpt2', 'lpt3', 'lpt4']
-    if name.lower() in reserved_names:
+    if name.lower() in _RESERVED_NAMES:
         raise ValidationError(f"'{name}' is a reserved system name")
     
     logger.debug(f"Validated module name: {name}")
     return name
 
-def validate_file_size(file_path: Path, max_size: int) -> None:
+def validate_file_size(file_path: Path, max_size: int,
+                       st: Optional[os.stat_result] = None) -> None:
     """
     Ensure file size is within acceptable limits.
-    
+
     Args:
         file_path: Path to file
         max_size: Maximum allowed size in bytes
-        
+        st: Optional pre-fetched stat result for file_path, so callers that
+            already stat'ed the file skip a second syscall
+
     Raises:
         SecurityError: If file exceeds size limit
     """
-    if not file_path.exists():
-        return
-    
-    size = file_path.stat().st_size
-    if size > max_size:
+    if st is None:
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
+            return
+
+    if st.st_size > max_size:
         raise SecurityError(
             f"File {file_path.name} exceeds maximum size ({max_size} bytes)"
         )
 
+@functools.lru_cache(maxsize=None)
+def _resolve(path: Path) -> Path:
+    """
+    Resolve a path once per process.
+
+    Path.resolve walks every component with realpath syscalls; module and
+    scope paths do not move during one invocation, so the result is safe
+    to memoize.
+    """
+    return path.resolve()
+
 def validate_path(path: Path, allowed_parent: Path) -> Path:
     """
     Validate that a path is within allowed directory.
-    
+
     Args:
         path: Path to validate
         allowed_parent: Parent directory that path must be under
-        
+
     Returns:
         Resolved absolute path
-        
+
     Raises:
         SecurityError: If path is outside allowed directory
     """
     try:
-        resolved = path.resolve()
-        allowed = allowed_parent.resolve()
+        resolved = _resolve(path)
+        allowed = _resolve(allowed_parent)
         
-        # Check if path is under allowed parent
-        if not str(resolved).startswith(str(allowed)):
+        # Check if path is under allowed parent; comparing path components
+        # avoids the prefix false-positive (/foo matching /foobar) and the
+        # two string allocations of the startswith approach
+        if not resolved.is_relative_to(allowed):
             raise SecurityError(f"Path {path} is outside allowed directory")
         
         # Check for symlinks (potential security issue)
@@ -161,27 +224,50 @@ def validate_path(path: Path, allowed_parent: Path) -> Path:
     except Exception as e:
         raise SecurityError(f"Path validation failed: {e}")
 
-def load_and_validate_meta(meta_file: Path) -> Dict:
+# Validated metadata keyed by file path, invalidated when the file's
+# (mtime, size) changes. Entries are read-only views so callers cannot
+# mutate the cached dict.
+_META_CACHE: Dict[str, Tuple[int, int, Dict]] = {}
+
+def load_and_validate_meta(meta_file: Path, st: Optional[os.stat_result] = None) -> Dict:
     """
     Load and validate meta.json with schema validation.
-    
+
+    Results are cached per file and reused until the file changes, so
+    repeated lookups in one invocation parse and validate only once.
+
     Args:
         meta_file: Path to meta.json file
-        
+        st: Optional pre-fetched stat result for meta_file, so callers that
+            already stat'ed the file (e.g. a scandir loop) avoid a second stat
+
     Returns:
-        Validated metadata dictionary
-        
+        Validated metadata dictionary (read-only view)
+
     Raises:
         InvalidModuleError: If metadata is invalid
     """
+    if st is None:
+        try:
+            st = meta_file.stat()
+        except OSError as e:
+            raise InvalidModuleError(f"Metadata validation failed: {e}")
+
+    cache_key = str(meta_file)
+    cached = _META_CACHE.get(cache_key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
     try:
-        # Check file size
-        validate_file_size(meta_file, MAX_META_SIZE)
-        
-        # Load JSON
-        with open(meta_file, 'r', encoding='utf-8') as f:
-            meta = json.load(f)
-        
+        # Check file size from the stat already in hand
+        if st.st_size > MAX_META_SIZE:
+            raise SecurityError(
+                f"File {meta_file.name} exceeds maximum size ({MAX_META_SIZE} bytes)"
+            )
+
+        # Load JSON from a single contiguous read
+        meta = _json_loads(meta_file.read_bytes())
+
         # Basic validation
         required_fields = ['name', 'version', 'description', 'lang', 'entry']
         for field in required_fields:
@@ -193,7 +279,7 @@ def load_and_validate_meta(meta_file: Path) -> Dict:
             raise InvalidModuleError(f"Unsupported language: {meta['lang']}")
         
         # Validate version format
-        if not re.match(r'^\d+\.\d+\.\d+$', meta['version']):
+        if not _VERSION_RE.match(meta['version']):
             raise InvalidModuleError(f"Invalid version format: {meta['version']}")
         
         # Validate entry script name
@@ -205,9 +291,12 @@ def load_and_validate_meta(meta_file: Path) -> Dict:
             )
         
         logger.debug(f"Validated metadata for module: {meta['name']}")
+        meta = types.MappingProxyType(meta)
+        _META_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, meta)
         return meta
-        
-    except json.JSONDecodeError as e:
+
+    except ValueError as e:
+        # Covers json.JSONDecodeError and orjson.JSONDecodeError alike
         raise InvalidModuleError(f"Invalid JSON in {meta_file}: {e}")
     except Exception as e:
         raise InvalidModuleError(f"Metadata validation failed: {e}")
@@ -222,40 +311,45 @@ def safe_open_editor(files: List[Path]) -> bool:
     Returns:
         True if editor opened successfully, False otherwise
     """
+    # Only the editor hand-off needs these; keep them off the startup path
+    import shlex
+    import subprocess
+
     editor = os.environ.get('EDITOR')
     
     if not editor:
         logger.debug("No EDITOR environment variable set")
         return False
     
-    # Whitelist of safe editors
-    safe_editors = {
-        'nano', 'vim', 'vi', 'emacs', 'code', 'notepad', 
-        'notepad++', 'subl', 'sublime', 'atom', 'gedit',
-        'kate', 'micro', 'joe', 'ne'
-    }
-    
     # Extract editor name (handle paths and arguments)
     editor_parts = shlex.split(editor)
     editor_path = Path(editor_parts[0])
     editor_name = editor_path.name.lower().replace('.exe', '')
-    
-    if editor_name not in safe_editors:
+
+    if editor_name not in _GUI_EDITORS and editor_name not in _TTY_EDITORS:
         logger.warning(f"Editor '{editor}' not in whitelist. Skipping auto-open.")
         return False
-    
+
+    editor_cmd = [editor] + [str(f) for f in files]
+
     try:
-        # Open with timeout to prevent hanging
-        result = subprocess.run(
-            [editor] + [str(f) for f in files],
-            timeout=1,
-            check=False
-        )
+        if editor_name in _GUI_EDITORS:
+            # GUI editors daemonize immediately; launch detached and return
+            # without waiting for the window to close
+            subprocess.Popen(
+                editor_cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+            logger.debug(f"Editor '{editor_name}' launched in background")
+            return True
+
+        # Terminal editors hold the foreground until the user finishes
+        result = subprocess.run(editor_cmd, check=False)
         return result.returncode == 0
-        
-    except subprocess.TimeoutExpired:
-        logger.debug("Editor opened in background (timeout)")
-        return True
+
     except FileNotFoundError:
         logger.warning(f"Editor '{editor}' not found")
         return False
@@ -263,133 +357,176 @@ def safe_open_editor(files: List[Path]) -> bool:
         logger.error(f"Failed to open editor: {e}")
         return False
 
-def set_secure_permissions(path: Path, is_script: bool = False) -> None:
+def _secure_opener(mode: int):
     """
-    Set secure file permissions.
-    
-    Args:
-        path: Path to file or directory
-        is_script: Whether this is an executable script
+    Returns an open() opener creating files with the given mode.
+
+    Creating the file with the right permission bits up front saves the
+    follow-up chmod syscall and closes the window where the file briefly
+    exists with default permissions.
     """
-    try:
-        if is_script:
-            # Scripts: rwx------ (700)
-            path.chmod(stat.S_IRWXU)
-        else:
-            # Other files: rw------- (600)
-            path.chmod(stat.S_IRUSR | stat.S_IWUSR)
-        
-        logger.debug(f"Set secure permissions on {path}")
-        
-    except Exception as e:
-        logger.warning(f"Failed to set permissions on {path}: {e}")
+    def opener(path, flags):
+        return os.open(path, flags, mode)
+    return opener
 
 # Core Functions
 def initialize_directories() -> None:
     """
     Creates the necessary directory structure for Footo if it doesn't exist.
     Includes security checks for symlinks and proper permissions.
-    
+
+    A sentinel file records the version that last completed initialization,
+    so the mkdir/chmod loop is skipped entirely on warm starts.
+
     Raises:
         SecurityError: If security violation detected
     """
     try:
-        # Create all directories at once to minimize race window
+        if INIT_SENTINEL.read_text(encoding='utf-8').strip() == FOOTO_VERSION:
+            return
+    except OSError:
+        pass
+
+    try:
+        # Create all directories at once to minimize race window, with the
+        # secure mode applied at creation rather than by a follow-up chmod
         for dir_path in [LOCAL_MODULES_DIR, BUNDLED_MODULES_DIR, COMMUNITY_MODULES_DIR]:
-            dir_path.mkdir(parents=True, exist_ok=True)
-            
-            # Verify they're actual directories, not symlinks
-            if dir_path.is_symlink():
+            dir_path.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+            # Verify they're actual directories, not symlinks; a single
+            # lstat answers both questions
+            mode = os.lstat(dir_path).st_mode
+            if stat.S_ISLNK(mode):
                 raise SecurityError(f"{dir_path} is a symbolic link - security risk")
-            
-            if not dir_path.is_dir():
+
+            if not stat.S_ISDIR(mode):
                 raise SecurityError(f"{dir_path} exists but is not a directory")
-            
-            # Set secure permissions (owner only)
-            set_secure_permissions(dir_path)
-        
+
+        with open(INIT_SENTINEL, 'w', encoding='utf-8', opener=_secure_opener(0o600)) as f:
+            f.write(FOOTO_VERSION)
+
         logger.info(f"Initialized Footo directories at: {FOTO_DIR}")
-        
+
     except SecurityError:
         raise
     except Exception as e:
         logger.error(f"Failed to initialize directories: {e}")
         raise FootoError(f"Directory initialization failed: {e}")
 
-def find_module(module_name: str) -> Tuple[Optional[Path], Optional[str]]:
+# Module locations already resolved in this process, keyed by name;
+# create_module drops its entry after making a new directory
+_FIND_CACHE: Dict[str, Tuple[Optional[Path], Optional[str]]] = {}
+
+def find_module(module_name: str, _validated: bool = False) -> Tuple[Optional[Path], Optional[str]]:
     """
     Find a module by name in available scopes.
-    
+
     Args:
         module_name: Name of module to find
-        
+        _validated: Skip name validation when the caller has already run it
+
     Returns:
         Tuple of (module_path, scope) or (None, None) if not found
     """
-    validate_module_name(module_name)
-    
+    if not _validated:
+        validate_module_name(module_name)
+
+    cached = _FIND_CACHE.get(module_name)
+    if cached is not None:
+        return cached
+
+    result: Tuple[Optional[Path], Optional[str]] = (None, None)
+
     # Search in order: local, bundled
     search_paths = [
         (LOCAL_MODULES_DIR / module_name, "local"),
         (BUNDLED_MODULES_DIR / module_name, "bundled")
     ]
-    
+
     for module_path, scope in search_paths:
-        if module_path.exists() and module_path.is_dir():
-            # Validate path is safe
-            try:
-                validate_path(module_path, MODULES_DIR)
-                logger.debug(f"Found module '{module_name}' in {scope} scope")
-                return module_path, scope
-            except SecurityError as e:
-                logger.error(f"Security violation for module {module_name}: {e}")
-                continue
-    
-    return None, None
+        # One stat covers both the existence and is-directory checks; any
+        # failure (missing, unreadable) means this scope has no usable
+        # candidate, matching the baseline exists() fall-through
+        try:
+            st = os.stat(module_path)
+        except OSError:
+            continue
+        if not stat.S_ISDIR(st.st_mode):
+            continue
+
+        # Validate path is safe
+        try:
+            validate_path(module_path, MODULES_DIR)
+            logger.debug(f"Found module '{module_name}' in {scope} scope")
+            result = (module_path, scope)
+            break
+        except SecurityError as e:
+            logger.error(f"Security violation for module {module_name}: {e}")
+            continue
+
+    _FIND_CACHE[module_name] = result
+    return result
 
 def list_modules() -> None:
     """Lists all available modules, grouped by scope."""
-    print("Available modules:")
-    
+    # Accumulate the listing and emit it with one write instead of taking
+    # the stdout lock for every line
+    out: List[str] = ["Available modules:"]
+    append = out.append
+
     def print_modules_in_scope(scope_dir: Path, scope_name: str) -> None:
-        print(f"\n  {scope_name}:")
-        
-        if not scope_dir.exists():
-            print("    (directory not found)")
-            return
-        
-        modules_found = False
-        
+        append(f"\n  {scope_name}:")
+
+        # One scandir pass provides the entries and their d_type, so the
+        # is_dir check below needs no extra stat per entry.
         try:
-            for module_dir in sorted(scope_dir.iterdir()):
-                if not module_dir.is_dir():
-                    continue
-                
-                modules_found = True
-                meta_file = module_dir / "meta.json"
-                
-                if meta_file.exists():
-                    try:
-                        meta = load_and_validate_meta(meta_file)
-                        print(f"    - {meta.get('name', module_dir.name)} (v{meta.get('version', 'N/A')})")
-                        desc = meta.get('description', '')
-                        if desc:
-                            print(f"      {desc[:80]}{'...' if len(desc) > 80 else ''}")
-                    except InvalidModuleError as e:
-                        logger.warning(f"Invalid module {module_dir.name}: {e}")
-                        print(f"    - {module_dir.name} (⚠ Invalid: {str(e)[:50]})")
-                else:
-                    print(f"    - {module_dir.name} (⚠ Missing meta.json)")
-        
+            with os.scandir(scope_dir) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except FileNotFoundError:
+            append("    (directory not found)")
+            return
         except PermissionError:
-            print("    (permission denied)")
+            append("    (permission denied)")
             return
-        
+
+        modules_found = False
+
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+
+            modules_found = True
+            meta_file = Path(entry.path) / "meta.json"
+
+            # Stat once; the result doubles as the existence check and is
+            # handed to load_and_validate_meta for its size check
+            try:
+                meta_st = os.stat(meta_file)
+            except FileNotFoundError:
+                append(f"    - {entry.name} (⚠ Missing meta.json)")
+                continue
+            except PermissionError:
+                # An unreadable module degrades its own entry; it must not
+                # abort the rest of the listing
+                append(f"    - {entry.name} (permission denied)")
+                continue
+
+            try:
+                meta = load_and_validate_meta(meta_file, st=meta_st)
+                append(f"    - {meta.get('name', entry.name)} (v{meta.get('version', 'N/A')})")
+                desc = meta.get('description', '')
+                if desc:
+                    append(f"      {desc[:80]}{'...' if len(desc) > 80 else ''}")
+            except InvalidModuleError as e:
+                logger.warning(f"Invalid module {entry.name}: {e}")
+                append(f"    - {entry.name} (⚠ Invalid: {str(e)[:50]})")
+
         if not modules_found:
-            print("    (no modules found)")
-    
+            append("    (no modules found)")
+
     print_modules_in_scope(LOCAL_MODULES_DIR, "Local")
     print_modules_in_scope(BUNDLED_MODULES_DIR, "Bundled")
+    sys.stdout.write('\n'.join(out) + '\n')
 
 def create_module(module_name: str) -> None:
     """
@@ -408,16 +545,19 @@ def create_module(module_name: str) -> None:
         module_path = LOCAL_MODULES_DIR / module_name
         
         # Check if already exists in any scope
-        existing_path, scope = find_module(module_name)
+        existing_path, scope = find_module(module_name, _validated=True)
         if existing_path:
             raise FootoError(f"Module '{module_name}' already exists in {scope} scope")
-        
+
         logger.info(f"Creating new module: {module_name}")
         print(f"Creating new module: {module_name} at {module_path}")
-        
-        # Create module directory with secure permissions
-        module_path.mkdir(parents=True, exist_ok=False)
-        set_secure_permissions(module_path)
+
+        # Keep the requested modes intact regardless of the inherited umask
+        os.umask(0o077)
+
+        # Create module directory with secure permissions in one step
+        module_path.mkdir(mode=0o700, parents=True, exist_ok=False)
+        _FIND_CACHE.pop(module_name, None)
         
         # Detect shell type (default to bash)
         script_lang = "bash"
@@ -433,9 +573,8 @@ def create_module(module_name: str) -> None:
         }
         
         meta_file = module_path / "meta.json"
-        with open(meta_file, 'w', encoding='utf-8') as f:
+        with open(meta_file, 'w', encoding='utf-8', opener=_secure_opener(0o600)) as f:
             json.dump(meta_content, f, indent=2)
-        set_secure_permissions(meta_file, is_script=False)
         
         # Create script template
         script_content = f"""#!/usr/bin/env {script_lang}
@@ -452,9 +591,8 @@ echo "Arguments: $@"
 """
         
         script_file = module_path / f"script{script_ext}"
-        with open(script_file, 'w', encoding='utf-8') as f:
+        with open(script_file, 'w', encoding='utf-8', opener=_secure_opener(0o700)) as f:
             f.write(script_content)
-        set_secure_permissions(script_file, is_script=True)
         
         print(f"✓ Module '{module_name}' created successfully.")
         print(f"  Location: {module_path}")
@@ -489,7 +627,7 @@ def get_module_info(module_name: str) -> None:
     """
     try:
         module_name = validate_module_name(module_name)
-        module_dir, scope = find_module(module_name)
+        module_dir, scope = find_module(module_name, _validated=True)
         
         if not module_dir:
             raise ModuleNotFoundError(f"Module '{module_name}' not found")
@@ -500,24 +638,29 @@ def get_module_info(module_name: str) -> None:
         
         meta = load_and_validate_meta(meta_file)
         
-        print(f"\nModule: {meta.get('name', module_name)}")
-        print(f"{'=' * 60}")
-        print(f"  Scope:       {scope}")
-        print(f"  Version:     {meta.get('version', 'N/A')}")
-        print(f"  Description: {meta.get('description', 'N/A')}")
-        print(f"  Language:    {meta.get('lang', 'N/A')}")
-        print(f"  Entry:       {meta.get('entry', 'N/A')}")
-        print(f"  Path:        {module_dir}")
-        
+        # Build the report and write it in one go
+        out = [
+            f"\nModule: {meta.get('name', module_name)}",
+            '=' * 60,
+            f"  Scope:       {scope}",
+            f"  Version:     {meta.get('version', 'N/A')}",
+            f"  Description: {meta.get('description', 'N/A')}",
+            f"  Language:    {meta.get('lang', 'N/A')}",
+            f"  Entry:       {meta.get('entry', 'N/A')}",
+            f"  Path:        {module_dir}",
+        ]
+
         if 'args' in meta and meta['args']:
-            print("\n  Arguments:")
+            out.append("\n  Arguments:")
             for arg in meta['args']:
-                print(f"    {arg.get('name', 'N/A')}:")
-                print(f"      Description: {arg.get('description', 'N/A')}")
-                print(f"      Type:        {arg.get('type', 'N/A')}")
+                out.append(f"    {arg.get('name', 'N/A')}:")
+                out.append(f"      Description: {arg.get('description', 'N/A')}")
+                out.append(f"      Type:        {arg.get('type', 'N/A')}")
                 if 'defaultValue' in arg:
-                    print(f"      Default:     {arg.get('defaultValue')}")
-        
+                    out.append(f"      Default:     {arg.get('defaultValue')}")
+
+        sys.stdout.write('\n'.join(out) + '\n')
+
         logger.debug(f"Displayed info for module: {module_name}")
         
     except (ValidationError, ModuleNotFoundError, InvalidModuleError) as e:
@@ -543,7 +686,7 @@ def run_module(module_name: str, args: List[str]) -> None:
     """
     try:
         module_name = validate_module_name(module_name)
-        module_dir, scope = find_module(module_name)
+        module_dir, scope = find_module(module_name, _validated=True)
         
         if not module_dir:
             raise ModuleNotFoundError(f"Module '{module_name}' not found")
@@ -561,14 +704,16 @@ def run_module(module_name: str, args: List[str]) -> None:
             raise InvalidModuleError("Missing 'lang' or 'entry' in metadata")
         
         entry_script_path = module_dir / entry_script_name
-        if not entry_script_path.exists():
+        try:
+            script_st = entry_script_path.stat()
+        except FileNotFoundError:
             raise InvalidModuleError(f"Entry script '{entry_script_name}' not found")
-        
-        # Validate script size
-        validate_file_size(entry_script_path, MAX_SCRIPT_SIZE)
+
+        # Validate script size, reusing the stat from the existence check
+        validate_file_size(entry_script_path, MAX_SCRIPT_SIZE, st=script_st)
         
         # Properly escape arguments for shell
-        escaped_args = [shlex.quote(arg) for arg in args]
+        escaped_args = [_shell_quote(arg) for arg in args]
         
         # Construct the sourcing command based on language
         if script_lang == "bash":
@@ -596,8 +741,6 @@ def run_module(module_name: str, args: List[str]) -> None:
 def main() -> None:
     """Main entry point for the Footo CLI."""
     try:
-        initialize_directories()
-        
         parser = argparse.ArgumentParser(
             description="Footo: A secure command interface for reusable terminal functions.",
             epilog="For more information, visit: https://github.com/yourusername/footo"
@@ -648,12 +791,19 @@ def main() -> None:
         )
         
         # Parse arguments
-        if len(sys.argv) > 1 and sys.argv[1] not in subparsers.choices:
-            # Treat as module execution (shorthand for 'run')
+        if len(sys.argv) > 1 and sys.argv[1] not in subparsers.choices \
+                and not sys.argv[1].startswith('-'):
+            # Treat as module execution (shorthand for 'run'); options like
+            # --version/--help still go to the parser itself
             args = parser.parse_args(['run'] + sys.argv[1:])
         else:
             args = parser.parse_args()
-        
+
+        # A real command is about to run; bring up logging and the
+        # directory tree now (--help/--version have already exited)
+        _configure_logging()
+        initialize_directories()
+
         # Execute command
         if args.command == "create":
             create_module(args.name)